@@ -0,0 +1,71 @@
+"""Feature-extraction benchmark on a set of sample pages.
+
+Times ``extract_features`` and ``extract_devanagari_features`` on every image
+in a directory (the sample uploads by default, skipping the ``processed_``
+copies). With ``--baseline REF`` the ``handwriting_features.py`` from that git
+revision is timed on the same images for comparison.
+
+Usage:
+    python benchmarks/features.py [images_dir] [--runs N] [--baseline REF]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import types
+
+import cv2
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import handwriting_features  # noqa: E402
+
+
+def load_revision(ref):
+    source = subprocess.run(
+        ["git", "show", f"{ref}:handwriting_features.py"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    module = types.ModuleType(f"handwriting_features@{ref}")
+    exec(compile(source, module.__name__, "exec"), module.__dict__)
+    return module
+
+
+def median_ms(fn, img, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(img)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", nargs="?", default=os.path.join(ROOT, "static", "uploads"))
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--baseline", metavar="REF", help="git revision to compare against")
+    args = parser.parse_args()
+
+    versions = [("current", handwriting_features)]
+    if args.baseline:
+        versions.insert(0, (args.baseline, load_revision(args.baseline)))
+
+    print(f"{'image':<40}{'version':>10}{'english (ms)':>15}{'devanagari (ms)':>18}")
+    for name in sorted(os.listdir(args.path)):
+        if name.startswith("processed_"):
+            continue
+        img = cv2.imread(os.path.join(args.path, name))
+        if img is None:
+            continue
+        for version, module in versions:
+            english = median_ms(module.extract_features, img, args.runs)
+            devanagari = median_ms(module.extract_devanagari_features, img, args.runs)
+            print(f"{name[:39]:<40}{version:>10}{english:>15.1f}{devanagari:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Replay a recorded frame sequence through the live practice analyzer.
+
+Frames are either the images in a directory (in filename order), the
+frames of a video file or, without a path, a generated sequence of a page
+being written line by line at the live page's 640 px frame size. Prints the
+per-frame latency and scores, then checks that the incrementally maintained
+features match a fresh full analysis of the last frame.
+
+Usage:
+    python benchmarks/live_replay.py [frames_dir | video] [--quiet] [--save DIR]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from live_analysis import LiveSession  # noqa: E402
+from blueprints.analysis import english_scores  # noqa: E402
+
+
+def synthetic_frames(seed=0):
+    # Words written one letter per frame, with repeated (unchanged) frames
+    # and a little sensor noise mixed in as a camera would give
+    rng = random.Random(seed)
+    page = np.full((480, 640), 255, np.uint8)
+    yield page.copy()
+    for line in range(6):
+        y = 70 + 70 * line
+        x = 30
+        for word in range(rng.randint(3, 5)):
+            for letter in "".join(rng.choice("abcdehklmnost") for _ in range(rng.randint(2, 6))):
+                cv2.putText(page, letter, (x, y), cv2.FONT_HERSHEY_SCRIPT_SIMPLEX, 1.4, 0, 2, cv2.LINE_AA)
+                x += rng.randint(18, 24)
+                frame = page.copy()
+                if rng.random() < 0.3:
+                    noise = np.array([rng.randint(-6, 6) for _ in range(64)], np.int16)
+                    frame = np.clip(frame.astype(np.int16) + np.resize(noise, frame.shape), 0, 255).astype(np.uint8)
+                yield frame
+                if rng.random() < 0.2:
+                    yield frame
+            x += rng.randint(25, 40)
+
+
+def read_frames(path):
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            frame = cv2.imread(os.path.join(path, name), cv2.IMREAD_GRAYSCALE)
+            if frame is not None:
+                yield frame
+        return
+
+    capture = cv2.VideoCapture(path)
+    while True:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        yield cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    capture.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", nargs="?", help="frames directory or video (default: a generated sequence)")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    parser.add_argument("--save", metavar="DIR", help="also write the frames to DIR as PNGs")
+    args = parser.parse_args()
+
+    frames = read_frames(args.path) if args.path else synthetic_frames()
+    if args.save:
+        os.makedirs(args.save, exist_ok=True)
+
+    session = LiveSession()
+    timings = []
+    for i, frame in enumerate(frames):
+        if args.save:
+            cv2.imwrite(os.path.join(args.save, f"{i:05d}.png"), frame)
+        start = time.perf_counter()
+        features, roi = session.update(frame)
+        ms = (time.perf_counter() - start) * 1000
+        timings.append(ms)
+        if not args.quiet:
+            print(f"{i:5d} {ms:7.2f} ms  roi={roi}  {english_scores(features)}")
+
+    if not timings:
+        sys.exit(f"No frames found in {args.path}")
+
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"frames={len(timings)} median={statistics.median(timings):.2f} ms p95={p95:.2f} ms")
+
+    incremental = session.features
+    match = session.recompute() == incremental
+    print("incremental matches full pass:", match)
+    sys.exit(0 if match else 1)
+
+
+if __name__ == "__main__":
+    main()
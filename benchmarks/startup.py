@@ -0,0 +1,58 @@
+"""Startup-time benchmark for the application factory.
+
+Each scenario runs in a fresh interpreter so import caches don't leak
+between runs. Compares a lazy start (heavy modules loaded on first use)
+against an eager start (everything imported up front, which is what every
+worker paid before the factory existed), and times the first ``/login``
+request in both cases.
+
+Usage:
+    python benchmarks/startup.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIO = """
+import time
+t0 = time.perf_counter()
+from app import create_app
+app = create_app({{'PRELOAD_HEAVY_MODULES': {preload}}})
+t1 = time.perf_counter()
+with app.test_client() as client:
+    client.get('/login')
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def run_scenario(preload, runs):
+    startup, first_request = [], []
+    code = SCENARIO.format(preload=preload)
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        startup.append(float(out[0]) * 1000)
+        first_request.append(float(out[1]) * 1000)
+    return statistics.median(startup), statistics.median(first_request)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<10}{'startup (ms)':>15}{'first /login (ms)':>20}")
+    for name, preload in (("lazy", False), ("eager", True)):
+        startup, first_request = run_scenario(preload, args.runs)
+        print(f"{name:<10}{startup:>15.1f}{first_request:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
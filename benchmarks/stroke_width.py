@@ -0,0 +1,85 @@
+"""Check the stroke-width statistics against strokes of known width.
+
+Draws horizontal and vertical bars of every width from 1 to 12 pixels, a
+page with bars of two widths, a page with one row of strokes per line and
+an all-ink page, runs ``extract_features`` on them and compares the
+measured mean, variance and per-line widths with the true ones. Exits
+non-zero if any of them is off.
+
+Usage:
+    python benchmarks/stroke_width.py [--max-width N]
+"""
+import argparse
+import math
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from handwriting_features import extract_features  # noqa: E402
+
+TOLERANCE = 0.05
+
+
+def bar(width, vertical=False):
+    img = np.full((200, 600), 255, np.uint8)
+    img[100:100 + width, 50:550] = 0
+    return img.T.copy() if vertical else img
+
+
+def bars(widths):
+    # Long horizontal bars one above the other
+    img = np.full((60 * len(widths) + 40, 600), 255, np.uint8)
+    for i, width in enumerate(widths):
+        y = 40 + 60 * i
+        img[y:y + width, 50:550] = 0
+    return img
+
+
+def lines_page(widths):
+    # One line of "text" per width: a row of upright strokes, like "llll"
+    img = np.full((80 * len(widths) + 40, 600), 255, np.uint8)
+    for i, width in enumerate(widths):
+        y = 40 + 80 * i
+        for x in range(50, 550, 25):
+            img[y:y + 40, x:x + width] = 0
+    return img
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-width", type=int, default=12)
+    args = parser.parse_args()
+    widths = list(range(1, args.max_width + 1))
+
+    ok = True
+    print(f"{'width':>5}{'horizontal':>12}{'vertical':>10}")
+    for width in widths:
+        measured = [extract_features(bar(width, vertical))["stroke_thickness"] for vertical in (False, True)]
+        ok &= all(abs(m - width) <= TOLERANCE for m in measured)
+        print(f"{width:>5}{measured[0]:>12.2f}{measured[1]:>10.2f}")
+
+    # Two equal-length strokes of widths a and b: mean (a + b) / 2 and
+    # variance ((a - b) / 2) ** 2
+    features = extract_features(bars([2, 5]))
+    mixed = (features["stroke_thickness"], features["stroke_width_var"])
+    ok &= abs(mixed[0] - 3.5) <= TOLERANCE and abs(mixed[1] - 2.25) <= TOLERANCE
+    print(f"widths 2 and 5: mean={mixed[0]:.2f} (3.50) var={mixed[1]:.2f} (2.25)")
+
+    per_line = extract_features(lines_page(widths))["stroke_width_per_line"]
+    ok &= len(per_line) == len(widths) and all(abs(m - w) <= TOLERANCE for m, w in zip(per_line, widths))
+    print("per line:", " ".join(f"{m:.2f}" for m in per_line))
+
+    # An all-ink page still has a finite width (JSON has no Infinity/NaN)
+    black = extract_features(np.zeros((200, 300), np.uint8))
+    ok &= all(math.isfinite(black[name]) for name in ("stroke_thickness", "stroke_width_var"))
+    print(f"all ink: mean={black['stroke_thickness']:.2f} var={black['stroke_width_var']:.2f}")
+
+    print("stroke widths match:", ok)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,460 @@
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from flask import Blueprint, current_app, jsonify, render_template, request, redirect, url_for, session
+from sqlalchemy import func
+from werkzeug.utils import secure_filename
+
+from extensions import db
+from models import AnalysisJob, Report
+
+analysis_bp = Blueprint('analysis', __name__)
+
+# Runs the full-resolution phase of result() off the request thread
+_executor = ThreadPoolExecutor(max_workers=2)
+
+# ✅ Helper function
+#English
+def find_weaknesses(scores):
+    weaknesses = []
+
+    if scores.get("neatness", 100) < 60:
+        weaknesses.append("neatness.html")
+
+    if scores.get("spacing", 100) < 60:
+        weaknesses.append("spacing.html")
+
+    if scores.get("consistency", 100) < 60:
+        weaknesses.append("consistency.html")
+
+    return weaknesses
+
+#Devanagari
+def find_devanagari_weaknesses(scores):
+    weaknesses = []
+
+    if scores.get("shirorekha", 100) < 60:
+        weaknesses.append("shirorekha")
+
+    if scores.get("matra", 100) < 60:
+        weaknesses.append("matra")
+
+    if scores.get("samanta", 100) < 60:
+        weaknesses.append("samanta")
+
+    return weaknesses
+
+# English scores from extract_features() output (also used by live practice)
+def english_scores(features):
+    neatness = max(0, 100 - abs(features["slant_angle"]))
+    spacing_score = max(0, 100 - abs(30 - features["avg_spacing"]))
+    consistency_score = max(0, 100 - abs(40 - features["avg_letter_height"]))
+
+    overall_score = (neatness + spacing_score + consistency_score) / 3
+
+    return {
+        "neatness": round(neatness, 1),
+        "spacing": round(spacing_score, 1),
+        "consistency": round(consistency_score, 1),
+        "overall": round(overall_score, 1)
+    }
+
+# ✅ Upload Page
+@analysis_bp.route('/upload', methods=['GET', 'POST'])
+def upload_file():
+    lang = request.form.get("language")
+    if request.method == 'POST':
+        file = request.files.get('file')
+        language = request.form.get('language')
+
+        if file and file.filename != '':
+            filename = secure_filename(file.filename)
+            save_path = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
+            file.save(save_path)
+
+            return redirect(url_for('analysis.result', filename=filename, lang=language))
+
+        return "No file selected!"
+    return render_template('upload.html')
+
+
+# Features measured in pixels, with the power of the scale they grow by.
+# Used to bring features from a downscaled preview back to full-resolution
+# units before scoring.
+PIXEL_FEATURES = {
+    "avg_letter_height": 1,
+    "avg_spacing": 1,
+    "stroke_thickness": 1,
+    "stroke_width_var": 2,
+    "height_variation": 1,
+}
+
+
+def devanagari_scores(features):
+    shirorekha_score = min(100, max(0, features["shirorekha_strength"] * 100))
+    matra_score = min(100, max(0, features["matra_score"] * 100))
+    samanta_score = max(0, 100 - features["height_variation"])
+
+    overall_score = (shirorekha_score + matra_score + samanta_score) / 3
+
+    return {
+        "shirorekha": round(shirorekha_score, 1),
+        "matra": round(matra_score, 1),
+        "samanta": round(samanta_score, 1),
+        "overall": round(overall_score, 1)
+    }
+
+
+def analyze_image(img, lang, scale=1.0):
+    """Features, scores, feedback and weak areas for one image.
+
+    ``scale`` is how much ``img`` was shrunk from the original upload; pixel
+    features are divided back so the scores stay comparable.
+    """
+    from handwriting_features import extract_features, extract_devanagari_features
+
+    # ----------------------------
+    # ✅ ENGLISH HANDWRITING MODEL
+    # ----------------------------
+    if lang in ["english", "eng"]:
+        features = _rescale_features(extract_features(img, scale), scale)
+        scores = english_scores(features)
+
+        feedback = []
+        if scores["neatness"] < 60:
+            feedback.append("Your handwriting slants too much. Try keeping letters upright.")
+        if scores["spacing"] < 60:
+            feedback.append("Spacing between words is inconsistent.")
+        if scores["consistency"] < 60:
+            feedback.append("Letter height varies. Practice maintaining uniform letter size.")
+        if len(feedback) == 0:
+            feedback.append("Your English handwriting is excellent!")
+
+        #Weak Areas
+        weak_areas = []
+        if scores["neatness"] < 60:
+            weak_areas.append("neatness")
+        if scores["spacing"] < 60:
+            weak_areas.append("spacing")
+        if scores["consistency"] < 60:
+            weak_areas.append("consistency")
+
+    # ----------------------------
+    # ✅ DEVANAGARI HANDWRITING MODEL
+    # ----------------------------
+    else:
+        features = _rescale_features(extract_devanagari_features(img, scale), scale)
+        scores = devanagari_scores(features)
+
+        feedback = []
+        if scores["shirorekha"] < 60:
+            feedback.append("Shirorekha (top line) is weak or broken. Try writing smoother top lines.")
+        if scores["matra"] < 60:
+            feedback.append("Matras are unclear or inconsistent.")
+        if scores["samanta"] < 60:
+            feedback.append("Letter height varies too much. Practice writing uniform characters.")
+        if len(feedback) == 0:
+            feedback.append("Your Devanagari handwriting is excellent!")
+
+        #Weak Ares
+        weak_areas = []
+        if scores["shirorekha"] < 60:
+            weak_areas.append("shirorekha")
+        if scores["matra"] < 60:
+            weak_areas.append("matra")
+        if scores["samanta"] < 60:
+            weak_areas.append("samanta")
+
+    return {
+        "features": features,
+        "scores": scores,
+        "feedback": feedback,
+        "weak_areas": weak_areas
+    }
+
+
+def _rescale_features(features, scale):
+    if scale == 1.0:
+        return features
+    for name, power in PIXEL_FEATURES.items():
+        if name in features:
+            features[name] /= scale ** power
+    if "stroke_width_per_line" in features:
+        features["stroke_width_per_line"] = [w / scale for w in features["stroke_width_per_line"]]
+    return features
+
+
+def _report_columns(scores, lang):
+    # Devanagari scores share the English columns (see reports())
+    if lang == "english":
+        keys = ("neatness", "spacing", "consistency")
+    else:
+        keys = ("shirorekha", "matra", "samanta")
+    return {
+        "neatness": scores[keys[0]],
+        "spacing": scores[keys[1]],
+        "consistency": scores[keys[2]],
+        "overall": scores["overall"]
+    }
+
+
+# ✅ Result Page
+# Phase one scores a downscaled proxy of the upload and renders right away;
+# phase two runs the full-resolution pipeline in the background and the page
+# polls result_status() for the final scores.
+@analysis_bp.route('/result/<filename>/<lang>')
+def result(filename, lang):
+
+    lang = lang.lower().strip()
+
+    if lang in ["hindi", "marathi", "dev"]:
+        lang = "devanagari"
+    if lang == "eng":
+        lang = "english"
+    print("Debug: Language received:", lang)
+
+    # OpenCV is only needed here, so it is imported on first use instead of
+    # at worker startup
+    import cv2
+    import numpy as np
+
+    start = time.perf_counter()
+    image_path = f"static/uploads/{filename}"
+    original_path = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
+    with open(original_path, "rb") as f:
+        data = f.read()
+    image_hash = hashlib.sha1(data).hexdigest()
+
+    # Repeat views of an image that was already analyzed (e.g. "View Report")
+    # reuse the final result instead of starting another job
+    job = AnalysisJob.query.filter_by(
+        image_path=image_path,
+        image_hash=image_hash,
+        language=lang,
+        status="final"
+    ).order_by(AnalysisJob.id.desc()).first()
+
+    if job:
+        analysis = json.loads(job.final_result)
+    else:
+        # Phase one: provisional scores from a low-resolution proxy
+        img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        scale = min(1.0, current_app.config['PREVIEW_MAX_SIDE'] / max(img.shape[:2]))
+        if scale < 1.0:
+            proxy = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            proxy = img
+        analysis = analyze_image(proxy, lang, scale)
+    scores = analysis["scores"]
+
+    # ✅ Save report to database if logged in
+    new_report = None
+    if 'user_id' in session:
+        new_report = Report.query.filter_by(
+            user_id=session['user_id'],
+            image_path=image_path,
+            language=lang
+        ).first()
+
+        if not new_report:
+            new_report = Report(
+                user_id=session['user_id'],
+                image_path=image_path,
+                processed_path=f"static/uploads/processed_{filename}",
+                weak_areas=",".join(analysis["weak_areas"]),
+                language=lang,
+                date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+                **_report_columns(scores, lang)
+            )
+            db.session.add(new_report)
+            db.session.flush()
+
+    job_id = None
+    if not job:
+        job = AnalysisJob(
+            report_id=new_report.id if new_report else None,
+            image_path=image_path,
+            image_hash=image_hash,
+            language=lang,
+            status="provisional",
+            provisional_overall=scores["overall"],
+            preview_ms=round((time.perf_counter() - start) * 1000, 1),
+            date=datetime.now().strftime("%Y-%m-%d %H:%M")
+        )
+        db.session.add(job)
+        db.session.commit()
+        job_id = job.id
+
+        # Phase two: full-resolution analysis in the background
+        processed_path = os.path.join(current_app.config['UPLOAD_FOLDER'], "processed_" + filename)
+        _executor.submit(_finish_analysis, current_app._get_current_object(),
+                         job.id, original_path, processed_path, lang)
+    else:
+        db.session.commit()
+
+    return render_template(
+        'result.html',
+        image_path=image_path,
+        processed_image=f"static/uploads/processed_{filename}",
+        features=analysis["features"],
+        scores=scores,
+        feedback=analysis["feedback"],
+        lang=lang,
+        report_id=new_report.id if new_report else None,
+        weak_areas=analysis["weak_areas"],
+        job_id=job_id
+    )
+
+
+def _finish_analysis(app, job_id, original_path, processed_path, lang):
+    import cv2
+
+    with app.app_context():
+        try:
+            start = time.perf_counter()
+            img = cv2.imread(original_path)
+
+            # Preprocessing
+            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            blur = cv2.GaussianBlur(gray, (5,5), 0)
+            _, thresh = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+            cv2.imwrite(processed_path, thresh)
+
+            final = analyze_image(img, lang)
+            scores = final["scores"]
+            full_ms = round((time.perf_counter() - start) * 1000, 1)
+
+            # Nothing is written until the analysis has succeeded, so a
+            # failure leaves no half-updated job or report behind
+            job = db.session.get(AnalysisJob, job_id)
+            job.full_ms = full_ms
+            job.final_overall = scores["overall"]
+            job.score_delta = round(scores["overall"] - job.provisional_overall, 1)
+            job.final_result = json.dumps(final)
+            job.status = "final"
+
+            # The report may have been deleted meanwhile; scores only ever go
+            # into a report of the same language
+            report = db.session.get(Report, job.report_id) if job.report_id else None
+            if report and report.language == lang:
+                for column, value in _report_columns(scores, lang).items():
+                    setattr(report, column, value)
+                report.weak_areas = ",".join(final["weak_areas"])
+
+            db.session.commit()
+            app.logger.info("analysis job %s: provisional %.1f, final %.1f, delta %+.1f",
+                            job_id, job.provisional_overall, job.final_overall, job.score_delta)
+        except Exception:
+            app.logger.exception("analysis job %s failed", job_id)
+            db.session.rollback()
+            job = db.session.get(AnalysisJob, job_id)
+            if job:
+                # The report keeps its preview scores until a later view of
+                # the image starts a new job
+                job.status = "failed"
+                db.session.commit()
+
+
+# ✅ Result Status (polled by the result page)
+@analysis_bp.route('/result/status/<int:job_id>')
+def result_status(job_id):
+    job = db.session.get(AnalysisJob, job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+
+    payload = {"status": job.status}
+    if job.status == "provisional" and _job_age(job) > current_app.config['ANALYSIS_JOB_TIMEOUT']:
+        # The background run never reported back (e.g. the worker restarted)
+        payload["status"] = "failed"
+    if job.status == "final":
+        payload.update(json.loads(job.final_result))
+        payload["score_delta"] = job.score_delta
+    return jsonify(payload)
+
+
+def _job_age(job):
+    # Seconds since the job was created (its date has minute resolution)
+    return (datetime.now() - datetime.strptime(job.date, "%Y-%m-%d %H:%M")).total_seconds()
+
+
+# ✅ Provisional vs. final score metric
+@analysis_bp.route('/result/metrics')
+def result_metrics():
+    rows = db.session.query(
+        AnalysisJob.language,
+        func.count(AnalysisJob.id),
+        func.avg(AnalysisJob.score_delta),
+        func.avg(func.abs(AnalysisJob.score_delta)),
+        func.max(func.abs(AnalysisJob.score_delta)),
+        func.avg(AnalysisJob.preview_ms),
+        func.avg(AnalysisJob.full_ms)
+    ).filter(AnalysisJob.status == "final").group_by(AnalysisJob.language).all()
+
+    return jsonify({
+        lang: {
+            "jobs": count,
+            "mean_delta": round(mean, 2),
+            "mean_abs_delta": round(mean_abs, 2),
+            "max_abs_delta": round(max_abs, 2),
+            "mean_preview_ms": round(preview_ms, 1),
+            "mean_full_ms": round(full_ms, 1)
+        }
+        for lang, count, mean, mean_abs, max_abs, preview_ms, full_ms in rows
+    })
+
+
+# ✅ View Report
+@analysis_bp.route('/view_report/<int:report_id>')
+def view_report(report_id):
+    report = Report.query.get(report_id)
+    if not report:
+        return "Report not found!"
+
+    # Recreate scores dict
+    if report.language == "english":
+        scores = {
+            "neatness": report.neatness,
+            "spacing": report.spacing,
+            "consistency": report.consistency,
+            "overall": report.overall
+        }
+    else:
+        scores = {
+            "shirorekha": report.neatness,
+            "matra": report.spacing,
+            "consistency": report.consistency,
+            "overall": report.overall
+        }
+
+    # Features are not saved in DB, so send empty dict
+    features = {}
+
+    # Decide language (simple detection)
+    lang = report.language
+
+    feedback = []
+    if scores["neatness"] < 60:
+        feedback.append("Your handwriting slants too much.")
+    if scores["spacing"] < 60:
+        feedback.append("Spacing between words is inconsistent.")
+    if scores["consistency"] < 60:
+        feedback.append("Letter height varies too much.")
+    if len(feedback) == 0:
+        feedback.append("Your handwriting is good!")
+
+
+    return render_template(
+        "result.html",
+        image_path=report.image_path,
+        processed_image=report.processed_path,
+        features=features,
+        scores=scores,
+        feedback=feedback,
+        lang=lang,
+        report_id=report.id,
+        weak_areas=report.weak_areas.split(",") if report.weak_areas else []
+    )
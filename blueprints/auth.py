@@ -0,0 +1,53 @@
+from flask import Blueprint, render_template, request, redirect, url_for, session
+
+from extensions import db, bcrypt
+from models import User
+
+auth_bp = Blueprint('auth', __name__)
+
+
+# ✅ Register
+@auth_bp.route('/register', methods=['GET', 'POST'])
+def register():
+    if request.method == 'POST':
+        name = request.form['name']
+        email = request.form['email']
+        password = bcrypt.generate_password_hash(request.form['password']).decode('utf-8')
+
+        # Check if email already exists
+        existing_user = User.query.filter_by(email=email).first()
+        if existing_user:
+            return "Email already exists! Try logging in instead."
+
+        user = User(name=name, email=email, password=password)
+        db.session.add(user)
+        db.session.commit()
+        return redirect(url_for('auth.login'))
+
+    return render_template('register.html')
+
+
+# ✅ Login
+@auth_bp.route('/login', methods=['GET', 'POST'])
+def login():
+    if request.method == 'POST':
+        email = request.form['email']
+        password = request.form['password']
+
+        user = User.query.filter_by(email=email).first()
+
+        if user and bcrypt.check_password_hash(user.password, password):
+            session['user_id'] = user.id
+            session['user_name'] = user.name
+            return redirect(url_for('home'))
+        else:
+            return "Invalid credentials!"
+
+    return render_template('login.html')
+
+
+# ✅ Logout
+@auth_bp.route('/logout')
+def logout():
+    session.clear()
+    return redirect(url_for('home'))
@@ -0,0 +1,65 @@
+import io
+import json
+import time
+
+from flask import Blueprint, current_app, render_template
+
+from extensions import sock
+from blueprints.analysis import english_scores
+
+live_bp = Blueprint('live', __name__)
+
+
+# ✅ Live Practice Page
+@live_bp.route('/practice/live')
+def live_practice():
+    return render_template('live_practice.html')
+
+
+# ✅ Live Practice Socket
+# The browser sends encoded frames (camera snapshots or the practice canvas)
+# as binary messages, or the text message "reset" to start over. Each frame
+# is answered with the current scores and the region that was re-analyzed.
+# Messages over SOCK_SERVER_OPTIONS' max_message_size close the socket, and
+# frames over LIVE_MAX_FRAME_SIDE are refused before they are decoded.
+@sock.route('/practice/live/ws', bp=live_bp)
+def live_socket(ws):
+    import cv2
+    import numpy as np
+    from PIL import Image
+    from live_analysis import LiveSession
+
+    max_side = current_app.config['LIVE_MAX_FRAME_SIDE']
+    session = LiveSession()
+    while True:
+        data = ws.receive()
+        if data is None:
+            break
+        if isinstance(data, str):
+            if data == "reset":
+                session.reset()
+            continue
+
+        start = time.perf_counter()
+        # Only the header is read here, so an oversized frame is never
+        # decoded into memory
+        try:
+            size = Image.open(io.BytesIO(data)).size
+        except (OSError, Image.DecompressionBombError):
+            size = None
+        if size and max(size) > max_side:
+            ws.send(json.dumps({"error": f"Frames can be at most {max_side} px on a side"}))
+            continue
+
+        frame = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_GRAYSCALE) if size else None
+        if frame is None:
+            ws.send(json.dumps({"error": "Could not decode frame"}))
+            continue
+        features, roi = session.update(frame)
+
+        ws.send(json.dumps({
+            "scores": english_scores(features),
+            "changed": roi is not None,
+            "roi": roi,
+            "ms": round((time.perf_counter() - start) * 1000, 1)
+        }))
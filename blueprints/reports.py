@@ -0,0 +1,266 @@
+import os
+
+from flask import Blueprint, current_app, render_template, redirect, url_for, session
+
+from extensions import db
+from models import Report
+
+reports_bp = Blueprint('reports', __name__)
+
+
+# ✅ Reports Page
+@reports_bp.route('/reports')
+def reports():
+    if 'user_id' not in session:
+        return redirect(url_for('auth.login'))
+
+    user_id = session.get('user_id')
+    user_reports = Report.query.filter_by(user_id=session['user_id']).all()
+
+    for r in user_reports:
+
+        # For English reports (values are real)
+        if r.language =="english":
+            scores = {
+                "neatness": r.neatness,
+                "spacing": r.spacing,
+                "consistency": r.consistency
+            }
+
+        # For Marathi / Devanagari reports
+        else:
+            scores = {
+                "shirorekha": r.neatness,
+                "matra": r.spacing,
+                "samanta": r.consistency
+            }
+
+        min_val = min(scores.values())
+        r.weak_areas = [k for k, v in scores.items() if v == min_val]
+
+    return render_template('reports.html', reports=user_reports)
+
+# ✅ Download report PDF
+
+@reports_bp.route('/download_report/<int:report_id>')
+def download_report(report_id):
+    report = Report.query.get(report_id)
+
+    if not report:
+        return "Report not found!"
+
+    filename = f"report_{report_id}.pdf"
+    filepath = os.path.join("static", "pdf_reports")
+
+    # Create folder if it doesn't exist
+    if not os.path.exists(filepath):
+        os.makedirs(filepath)
+
+    full_path = os.path.join(filepath, filename)
+
+    # ReportLab is only needed for PDF export, so load it on first use
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.utils import ImageReader
+
+    # Create PDF
+    c = canvas.Canvas(full_path, pagesize=letter)
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(50, 750, "AI Handwriting Analysis Report")
+
+    c.setFont("Helvetica", 12)
+    c.drawString(50, 720, f"Date: {report.date}")
+    c.drawString(50, 700, f"User ID: {report.user_id}")
+
+    # Images
+    try:
+        c.drawImage(
+            ImageReader(os.path.join(current_app.root_path, report.image_path)),
+            50, 500, width=200, height=150
+        )
+        c.drawString(50, 660, "Original Handwriting")
+    except:
+        pass
+
+    try:
+        c.drawImage(ImageReader(report.processed_path), 300, 500, width=200, height=150)
+        c.drawString(300, 660, "Processed Image")
+    except:
+        pass
+
+    # Scores
+    c.drawString(50, 450, f"Neatness: {report.neatness}%")
+    c.drawString(50, 430, f"Spacing: {report.spacing}%")
+    c.drawString(50, 410, f"Consistency: {report.consistency}%")
+    c.drawString(50, 390, f"Overall Score: {report.overall}%")
+
+    # Close PDF
+    c.save()
+
+    return redirect(f"/static/pdf_reports/{filename}")
+
+# ✅ Dashboard
+@reports_bp.route('/dashboard')
+def dashboard():
+    if 'user_id' not in session:
+        return redirect(url_for('auth.login'))
+
+    user_id = session['user_id']
+
+    # Fetch all reports for this user
+    user_reports =Report.query.filter_by(user_id=user_id).order_by(Report.date.asc()).all()
+
+    # If not user_reports yet
+    if not user_reports:
+        return render_template('dashboard.html', reports=[], scores=[])
+
+    # Extract all scores
+    overall_scores = [r.overall for r in user_reports]
+    neatness_scores = [r.neatness for r in user_reports]
+    spacing_scores = [r.spacing for r in user_reports]
+    consistency_scores = [r.consistency for r in user_reports]
+
+    # Total reports
+    total_reports = len(user_reports)
+
+     # Averages
+    avg_neatness = sum(neatness_scores) / total_reports
+    avg_spacing = sum(spacing_scores) / total_reports
+    avg_consistency = sum(consistency_scores) / total_reports
+    avg_overall = sum(overall_scores) / total_reports
+
+    # Determine badge
+    if total_reports >= 21:
+        badge = "Expert"
+        badge_color = "#d9534f"   # red
+    elif total_reports >= 11:
+        badge = "Advanced"
+        badge_color = "#f0ad4e"   # orange
+    elif total_reports >= 4:
+        badge = "Intermediate"
+        badge_color = "#5cb85c"   # green
+    else:
+        badge = "Beginner"
+        badge_color = "#0275d8"   # blue
+
+    # Badge Progress Logic
+ 
+    if total_reports < 4:
+        next_badge = "Intermediate"
+        remaining = 4 - total_reports
+
+    elif total_reports < 11:
+        next_badge = "Advanced"
+        remaining = 11 - total_reports
+
+    elif total_reports < 21:
+        next_badge = "Expert"
+        remaining = 21 - total_reports
+
+    else:
+        next_badge = "Max Level Reached"
+        remaining = 0
+
+
+
+    # Best & Worst
+    best_overall = max(overall_scores)
+    worst_overall = min(overall_scores)
+
+    # Improvement %
+    if overall_scores[0] == 0:
+        improvement = 0
+    else:
+        improvement = ((overall_scores[-1] - overall_scores[0]) / overall_scores[0]) * 100
+
+    # AI Suggestions
+    suggestions = []
+
+    if improvement > 10:
+        suggestions.append("Great job! Your handwriting has improved significantly.")
+    elif improvement < -5:
+        suggestions.append("Your score dropped recently. Try slowing down your writing and focusing on shapes.")
+    else:
+        suggestions.append("Your handwriting is stable. Try practicing curves and slants to improve further.")
+
+    if avg_spacing < 40:
+        suggestions.append("Your spacing is tight. Try practicing equal spacing between letters.")
+    elif avg_spacing > 70:
+        suggestions.append("Your spacing is wide. Try keeping letters closer to improve consistency.")
+
+    if avg_consistency < 50:
+        suggestions.append("Your letter consistency needs attention. Try rewriting the same word multiple times.")
+
+    if avg_neatness < 50:
+        suggestions.append("Work on your neatness. Practice writing slowly and cleanly for 5 minutes daily.")
+
+    # Statistics
+    stats = {
+        "total_reports": total_reports,
+        "best_score": best_overall,
+        "average_score": avg_overall,
+        "worst_score": worst_overall
+    }
+
+    # Dates for charts
+    dates = [r.date for r in user_reports]
+
+
+    # Prepare data for charts
+    dates = [r.date for r in user_reports]
+    overall_scores = [r.overall for r in user_reports]
+    neatness_scores = [r.neatness for r in user_reports]
+    spacing_scores = [r.spacing for r in user_reports]
+    consistency_scores = [r.consistency for r in user_reports]
+
+    return render_template(
+        "dashboard.html",
+        reports=user_reports,
+        stats=stats,
+        total_reports=total_reports,
+        avg_neatness=avg_neatness,
+        avg_spacing=avg_spacing,
+        avg_consistency=avg_consistency,
+        avg_overall=round(avg_overall,2),
+        best_overall=best_overall,
+        worst_overall=worst_overall,
+        improvement=round(improvement,2),
+        suggestions=suggestions,
+        dates=dates,
+        overall_scores=overall_scores,
+        neatness_scores=neatness_scores,
+        spacing_scores=spacing_scores,
+        consistency_scores=consistency_scores,
+        badge_color=badge_color,
+        next_badge=next_badge,
+        remaining=remaining,
+    	badge=badge
+    )
+
+# ✅ Delete Report
+
+@reports_bp.route('/delete_report/<int:report_id>', methods=['POST'])
+def delete_report(report_id):
+    if 'user_id' not in session:
+        return redirect(url_for('auth.login'))
+
+    report = Report.query.filter_by(id=report_id, user_id=session['user_id']).first()
+
+    if not report:
+        return "Report not found or unauthorized!", 404
+
+
+    # Delete image files
+    try:
+        if os.path.exists(report.image_path):
+            os.remove(report.image_path)
+        if os.path.exists(report.processed_path):
+            os.remove(report.processed_path)
+    except:
+        pass
+
+    # Delete DB record
+    db.session.delete(report)
+    db.session.commit()
+
+    return redirect(url_for('reports.reports'))
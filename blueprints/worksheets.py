@@ -0,0 +1,152 @@
+import os
+
+from flask import Blueprint, abort, current_app, redirect, render_template, request, send_file, url_for
+
+worksheets_bp = Blueprint('worksheets', __name__)
+
+# Ready-made practice sheets: name -> (heading, lines). Each fits one page.
+PRACTICE_SHEETS = {
+    "english_az": ("English A–Z Practice Sheet",
+                   ["A a", "B b", "C c", "D d", "E e", "F f",
+                    "G g", "H h", "I i", "J j", "K k", "L l"]),
+    "cursive": ("Cursive Practice Sheet",
+                ["aa bb cc", "dd ee ff", "gg hh ii", "jj kk ll", "mm nn oo",
+                 "pp qq rr", "ss tt uu", "vv ww xx", "yy zz"]),
+    "matra": ("Devanagari Matra Practice",
+              ["का", "कि", "की", "कु", "कू", "के", "कै", "को", "कौ", "कं", "क:", "का"]),
+    "shirorekha": ("Shirorekha Practice Sheet",
+                   ["क", "ख", "ग", "घ", "त", "न", "म", "फ", "थ", "ध", "भ", "श"]),
+}
+
+# Ready-made sheets keep their URL across deploys, so they are cached for a
+# day. Generated files are named by a hash of their parameters and the
+# renderer version (worksheet_service.RENDER_VERSION), so a changed sheet
+# gets a new URL and each file can be cached for good
+SHEET_MAX_AGE = 24 * 60 * 60
+GENERATED_MAX_AGE = 365 * 24 * 60 * 60
+
+# ✅ Worksheets
+
+@worksheets_bp.route("/worksheet", methods=["GET", "POST"])
+def worksheet():
+    if request.method == "GET":
+        return render_template("worksheet_form.html")  
+    heading = request.form.get("heading", "").strip()
+    is_double_line = request.form.get("double_line") == "on"
+    fmt = request.form.get("format", "html")
+
+    user_text = request.form.get("text", "")
+    if not heading or not user_text.strip():
+        abort(400, "A worksheet needs a heading and some practice text.")
+    text_lines = [t.strip() for t in user_text.split("\n")]
+
+    # Bounds the work (and the PDF/PNG size) a single form post can cause
+    max_lines = current_app.config['WORKSHEET_MAX_LINES']
+    max_length = current_app.config['WORKSHEET_MAX_LINE_LENGTH']
+    if len(text_lines) > max_lines:
+        abort(400, f"A worksheet can have at most {max_lines} lines.")
+    if any(len(t) > max_length for t in [heading, *text_lines]):
+        abort(400, f"The heading and each line can be at most {max_length} characters.")
+
+    if fmt in ("pdf", "png"):
+        path = _worksheet_file(heading, text_lines, is_double_line, fmt)
+        return redirect(url_for('worksheets.generated_worksheet', filename=os.path.basename(path)))
+
+    lines = []
+    for t in text_lines:
+        lines.append({
+            "sample": t,
+            "type": "double" if is_double_line else "single"
+        })
+
+    return render_template("worksheet.html", heading=heading, lines=lines)
+
+
+# ✅ Printable Worksheets (PDF / PNG)
+
+@worksheets_bp.route("/worksheet/sheet/<name>.<any(pdf, png):fmt>")
+def sheet_file(name, fmt):
+    if name not in PRACTICE_SHEETS:
+        abort(404)
+    heading, lines = PRACTICE_SHEETS[name]
+    path = _worksheet_file(heading, lines, False, fmt)
+    return send_file(path, download_name=f"{name}_worksheet.{fmt}", max_age=SHEET_MAX_AGE)
+
+
+def _worksheet_file(heading, lines, double_line, fmt):
+    from worksheet_service import worksheet_file
+    from worksheet_text import UnsupportedWorksheet, WorksheetTooLong
+
+    try:
+        return worksheet_file(heading, lines, double_line, fmt,
+                              cache_dir=current_app.config['WORKSHEET_CACHE_FOLDER'],
+                              max_files=current_app.config['WORKSHEET_CACHE_MAX_FILES'])
+    except UnsupportedWorksheet as e:
+        # e.g. Devanagari PNGs on a Pillow without libraqm
+        abort(501, str(e))
+    except WorksheetTooLong as e:
+        abort(400, str(e))
+
+
+@worksheets_bp.route("/worksheet/generated/<filename>")
+def generated_worksheet(filename):
+    path = os.path.join(current_app.config['WORKSHEET_CACHE_FOLDER'], os.path.basename(filename))
+    if not os.path.isfile(path):
+        abort(404)
+    return send_file(path, max_age=GENERATED_MAX_AGE)
+
+
+# ✅ Open Worksheets
+
+@worksheets_bp.route("/worksheet/<filename>")
+def open_worksheet(filename):
+    return render_template(f"{filename }.html")
+
+@worksheets_bp.route("/worksheet/devanagari/<file>")
+def devanagari_worksheet(file):
+    return render_template(f"dev_{file}.html")
+
+
+# ✅ Full Page Practice 
+@worksheets_bp.route("/full_practice/<text>")
+def full_practice(text):
+    return render_template("full_page_practice.html",
+                           heading="Full Page Practice",
+                           trace_text=text)
+
+@worksheets_bp.route("/practice")
+def practice_menu():
+    return render_template("practice_menu.html")
+
+
+@worksheets_bp.route("/worksheet/english/az")
+def english_az_sheet():
+    return _practice_sheet("english_az")
+
+
+@worksheets_bp.route("/worksheet/cursive")
+def cursive_sheet():
+    return _practice_sheet("cursive")
+
+
+@worksheets_bp.route("/worksheet/devanagari/Matra")
+def devanagari_matra_sheet():
+    return _practice_sheet("matra")
+
+
+@worksheets_bp.route("/worksheet/devanagari/Shirorekha")
+def devanagari_shirorekha_sheet():
+    return _practice_sheet("shirorekha")
+
+
+def _practice_sheet(name):
+    # Only the cheap script checks here; the renderer loads on download
+    from worksheet_text import pdf_supported, png_supported
+
+    heading, lines = PRACTICE_SHEETS[name]
+    return render_template("full_page_practice.html",
+                           heading=heading,
+                           lines=lines,
+                           sheet_name=name,
+                           pdf_available=pdf_supported(heading, lines),
+                           png_available=png_supported(heading, lines))
@@ -0,0 +1,8 @@
+from flask_sqlalchemy import SQLAlchemy
+from flask_bcrypt import Bcrypt
+from flask_sock import Sock
+
+# Extensions are created unbound and attached to an app in create_app()
+db = SQLAlchemy()
+bcrypt = Bcrypt()
+sock = Sock()
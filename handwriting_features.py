@@ -1,7 +1,10 @@
 import cv2
 import numpy as np
 
-def extract_features(img):
+def extract_features(img, scale=1.0):
+    # scale: how much img was shrunk from the original upload. The fixed
+    # pixel sizes below shrink with it, so a downscaled preview keeps the
+    # same strokes and letters as the full image
 
     # Convert to grayscale if needed
     if len(img.shape) == 3:
@@ -9,64 +12,203 @@ def extract_features(img):
     else:
         gray = img
 
-    # Threshold
-    _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    # Threshold, into a buffer with a 1-pixel background border: the
+    # distance transform then always has background to measure to (an
+    # all-ink image would otherwise come out infinite) and neighbour
+    # lookups around any ink pixel stay in range
+    height, width = gray.shape
+    padded = np.zeros((height + 2, width + 2), np.uint8)
+    thresh = padded[1:-1, 1:-1]
+    cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU, dst=thresh)
+
+    # The slant's edge map is only needed by the Hough transform, so its
+    # buffer is reused for the stroke skeleton below
+    ridge = np.empty_like(padded)
 
     # 1. Slant Detection
-    edges = cv2.Canny(thresh, 50, 150)
-    lines = cv2.HoughLines(edges, 1, np.pi / 180, 120)
-    slant_angle = 0
-    if lines is not None:
-        for line in lines[:10]:
-            rho, theta = line[0]
-            angle = (theta * 180 / np.pi) - 90
-            slant_angle += angle
-        slant_angle /= len(lines[:10])
+    slant_angle = hough_slant(thresh, scale, edges=ridge[1:-1, 1:-1])
+
+    # 2. Stroke Width
+    # Distance to the nearest background pixel; on the skeleton (the ridge
+    # of the distance map) a stroke of odd width w has one centre pixel at
+    # (w + 1) / 2. An even stroke has two centre pixels at w / 2 side by
+    # side, so a ridge pixel with an equal neighbour both along and across
+    # the stroke is counted as 2 * distance, at half weight
+    dist = cv2.distanceTransform(padded, cv2.DIST_L2, 5)
+    cv2.compare(dist, cv2.dilate(dist, np.ones((3, 3), np.uint8)), cv2.CMP_GE, dst=ridge)
+    cv2.bitwise_and(ridge, padded, dst=ridge)
+    points = cv2.findNonZero(ridge)
+    xs, ys = points.reshape(-1, 2).T if points is not None else np.zeros((2, 0), int)
 
-    # 2. Stroke Thickness
-    kernel = np.ones((3, 3), np.uint8)
-    thick = cv2.dilate(thresh, kernel, iterations=1)
-    stroke_thickness = np.mean(thick / 255)
+    # Distances of each skeleton pixel and its four neighbours, looked up
+    # by flat index (the border keeps every neighbour inside the map)
+    stride = padded.shape[1]
+    flat = dist.ravel()
+    at = ys * stride + xs
+    d = flat[at]
+    same_v = (flat[at - stride] == d) | (flat[at + stride] == d)
+    same_h = (flat[at - 1] == d) | (flat[at + 1] == d)
+    plateau = same_v & same_h
+    weight = 1 - 0.5 * plateau
+    width_px = 2 * d - 1 + plateau
 
-    # 3. Letter Height
-    contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    heights = [cv2.boundingRect(c)[3] for c in contours if cv2.boundingRect(c)[3] > 10]
-    avg_letter_height = np.mean(heights) if heights else 0
+    # Per-row weight, width sum and squared-width sum are all the width
+    # statistics need, for the page and for each text line. The width sum
+    # of a row is also roughly its ink (each stroke crossing it adds its
+    # width), so it doubles as the row profile the lines are found from
+    rows = padded.shape[0]
+    row_n = np.bincount(ys, weight, minlength=rows)
+    row_d = np.bincount(ys, weight * width_px, minlength=rows)
+    row_d2 = np.bincount(ys, weight * width_px * width_px, minlength=rows)
+    stroke_thickness, stroke_width_var = _width_stats(row_n.sum(), row_d.sum(), row_d2.sum())
+
+    lines = _text_lines(row_d, width, 5 * scale)
+    stroke_width_per_line = [
+        _width_stats(row_n[y0:y1].sum(), row_d[y0:y1].sum(), row_d2[y0:y1].sum())[0]
+        for y0, y1 in lines
+    ]
+
+    # 3. Letter Height (one bounding box per contour, shared with spacing)
+    # (on the padded mask: the border shifts every box by one pixel, which
+    # heights and gaps do not see)
+    contours, _ = cv2.findContours(padded, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    boxes = np.array([cv2.boundingRect(c) for c in contours]).reshape(-1, 4)
+    heights = boxes[boxes[:, 3] > 10 * scale, 3]
+    avg_letter_height = np.mean(heights) if len(heights) else 0
 
     # 4. Spacing (between contours)
-    xs = sorted([cv2.boundingRect(c)[0] for c in contours])
-    gaps = np.diff(xs)
+    gaps = np.diff(np.sort(boxes[:, 0]))
     avg_spacing = np.mean(gaps) if len(gaps) > 1 else 0
 
     return {
         "slant_angle": float(slant_angle),
         "stroke_thickness": float(stroke_thickness),
+        "stroke_width_var": float(stroke_width_var),
+        "stroke_width_per_line": stroke_width_per_line,
         "avg_letter_height": float(avg_letter_height),
         "avg_spacing": float(avg_spacing)
     }
 
-def extract_devanagari_features(img):
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    blur = cv2.GaussianBlur(gray, (5,5), 0)
-    _, thresh = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+def hough_slant(thresh, scale=1.0, edges=None):
+    # Mean angle of the ten strongest straight lines in the ink mask's
+    # edges. Also used by live practice so both score neatness the same
+    # way; ``edges`` optionally receives the edge map
+    edges = cv2.Canny(thresh, 50, 150, edges=edges)
+    lines = cv2.HoughLines(edges, 1, np.pi / 180, max(1, round(120 * scale)))
+    slant_angle = 0
+    if lines is not None:
+        for line in lines[:10]:
+            rho, theta = line[0]
+            angle = (theta * 180 / np.pi) - 90
+            slant_angle += angle
+        slant_angle /= len(lines[:10])
+    return slant_angle
+
+def _width_stats(n, d, d2):
+    # Mean and variance of stroke width over skeleton pixels of total
+    # weight n, given the weighted sum and squared sum of their widths
+    if not n:
+        return 0.0, 0.0
+    mean = d / n
+    return float(mean), float(d2 / n - mean ** 2)
+
+
+def _text_lines(row_profile, width, min_height=5):
+    # Bands of consecutive rows that carry ink, one per line of text
+    min_ink = max(1, int(0.01 * width))
+    mask = np.concatenate(([0], (row_profile >= min_ink).astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(mask))
+    return [(y0, y1) for y0, y1 in zip(edges[::2], edges[1::2]) if y1 - y0 >= min_height]
+
+
+def _binarize(blur, scale=1.0):
+    # Ink as 1, paper as 0. A global Otsu level fails on photos with a dark
+    # border or uneven light (most of the page comes out as ink), so those
+    # fall back to a local mean threshold
+    _, binary = cv2.threshold(blur, 0, 1, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    if np.count_nonzero(binary) > binary.size // 2:
+        block = max(round(15 * scale) | 1, min(blur.shape) // 20 | 1)
+        binary = cv2.adaptiveThreshold(blur, 1, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, block, 20)
+    return binary
+
+
+def _runs(mask):
+    # Start and end indices of the runs of True in a 1-D mask
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return edges[::2], edges[1::2]
+
+
+def extract_devanagari_features(img, scale=1.0):
+    # scale as in extract_features()
+    if len(img.shape) == 3:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = img
+    ksize = max(1, round(5 * scale)) | 1
+    blur = cv2.GaussianBlur(gray, (ksize, ksize), 0)
+    binary = _binarize(blur, scale)
+
+    # Rows or columns inked across most of the page are frame edges or
+    # margins rather than writing, so they are blanked first
+    height, width = binary.shape
+    frame_rows = cv2.reduce(binary, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() >= 0.8 * width
+    frame_cols = cv2.reduce(binary, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() >= 0.8 * height
+    binary[frame_rows] = 0
+    binary[:, frame_cols] = 0
 
-    # Feature 1: Shirorekha Presence (Top Line)
-    row_sum = np.sum(thresh[:20, :])
-    shirorekha_strength = row_sum / (thresh.shape[1] * 255)
+    # One integral image serves the row and column profiles and every box
+    # sum below
+    integral = cv2.integral(binary)
+    row_profile = integral[1:, -1] - integral[:-1, -1]
+    lines = _text_lines(row_profile, width, 5 * scale)
 
-    # Feature 2: Matra Detection (vertical marks)
-    vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 20))
-    matras = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, vertical_kernel)
-    matra_score = np.sum(matras) / (thresh.size * 255)
+    headline_ink = 0
+    line_span = 0
+    stem_extent = 0
+    for y0, y1 in lines:
+        col_profile = (integral[y1, 1:] - integral[y1, :-1]) - (integral[y0, 1:] - integral[y0, :-1])
+        cols = np.flatnonzero(col_profile)
+        x0, x1 = cols[0], cols[-1] + 1
+        line_span += x1 - x0
 
-    # Feature 3: Character Height Consistency
-    contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    heights = [cv2.boundingRect(c)[3] for c in contours if cv2.boundingRect(c)[3] > 20]
+        # Feature 1: Shirorekha (headline) - around the densest row in the
+        # upper half of this line, the share of the line covered by
+        # continuous strokes at least half a line long. Latin letters only
+        # give short runs there, a headline joins a whole word
+        line_height = y1 - y0
+        head = y0 + int(np.argmax(row_profile[y0:y0 + max(1, line_height // 2)]))
+        reach = max(1, line_height // 16)
+        h0, h1 = max(y0, head - reach), min(y1, head + reach + 1)
+        starts, ends = _runs(binary[h0:h1, x0:x1].any(axis=0))
+        words = ends - starts >= line_height / 2
+        starts, ends = starts[words], ends[words]
+        headline_ink += int((ends - starts).sum())
+
+        # Feature 2: Matra Detection (vertical marks) - stems hanging from
+        # the headline, i.e. columns inked for most of the quarter line
+        # below it, counted from the column sums of that box
+        s0, s1 = h1, min(y1, h1 + max(round(3 * scale), 1, line_height // 4))
+        if s1 <= s0 or not len(starts):
+            continue
+        below = (integral[s1, x0 + 1:x1 + 1] - integral[s1, x0:x1]) - (integral[s0, x0 + 1:x1 + 1] - integral[s0, x0:x1])
+        stem_cols = below >= 0.6 * (s1 - s0)
+        stems = sum(len(_runs(stem_cols[a:b])[0]) for a, b in zip(starts, ends))
+        # Each akshara is roughly as wide as the body under the headline
+        # is tall and carries one stem, so this is ~1 for well-formed text
+        stem_extent += stems * (y1 - h1)
+
+    shirorekha_strength = headline_ink / line_span if line_span else 0
+    matra_score = min(1.0, stem_extent / line_span) if line_span else 0
+
+    # Feature 3: Character Height Consistency - a single outer-contour
+    # pass with one bounding box per component
+    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    heights = [h for h in (cv2.boundingRect(c)[3] for c in contours) if h > 20 * scale]
     height_variation = np.std(heights) if len(heights) > 2 else 0
 
     return {
         "shirorekha_strength": float(shirorekha_strength),
         "matra_score": float(matra_score),
-        "height_variation": float(height_variation)
+        "height_variation": float(height_variation),
+        "line_count": len(lines)
     }
-
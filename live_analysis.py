@@ -0,0 +1,113 @@
+import cv2
+import numpy as np
+
+from handwriting_features import hough_slant
+
+
+class LiveSession:
+    """Incremental feature extraction over a stream of practice frames.
+
+    Each frame is compared with the previous one and only the changed region
+    is re-thresholded. Components (one bounding box per outer contour) are
+    kept between frames; those touching the changed region are dropped and
+    re-found from the updated mask, the rest are reused as-is.
+
+    The features mirror extract_features() so the same scoring applies.
+    Slant is the same Hough measure over the whole mask, redone on every
+    changed frame (a few milliseconds at the page's 640 px frame size).
+    """
+
+    def __init__(self, diff_threshold=25, min_changed=20, pad=8):
+        self.diff_threshold = diff_threshold
+        self.min_changed = min_changed
+        self.pad = pad
+        self.reset()
+
+    def reset(self):
+        self.gray = None
+        self.mask = None
+        self.level = None
+        self.components = []
+        self.features = None
+
+    def update(self, frame):
+        """Feed one frame; returns ``(features, roi)``.
+
+        ``roi`` is the ``(x, y, w, h)`` region that was re-analyzed, or
+        ``None`` when the frame did not change enough to matter.
+        """
+        if len(frame.shape) == 3:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = frame
+
+        if self.gray is None or gray.shape != self.gray.shape:
+            # First frame (or new resolution): fix the Otsu level for the
+            # session so later partial updates threshold consistently
+            self.level, self.mask = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+            mean, std = cv2.meanStdDev(gray)
+            if std[0, 0] < 10:
+                # Blank page or canvas: Otsu has nothing to split, so treat
+                # anything clearly darker than the paper as ink
+                self.level, self.mask = cv2.threshold(gray, max(0.0, mean[0, 0] - 40), 255, cv2.THRESH_BINARY_INV)
+            self.components = self._find_components(0, 0, gray.shape[1], gray.shape[0])
+            self.gray = gray
+            self.features = self._features()
+            return self.features, (0, 0, gray.shape[1], gray.shape[0])
+
+        # Frame differencing
+        _, changed = cv2.threshold(cv2.absdiff(gray, self.gray), self.diff_threshold, 255, cv2.THRESH_BINARY)
+        if cv2.countNonZero(changed) < self.min_changed:
+            return self.features, None
+        self.gray = gray
+
+        x, y, w, h = cv2.boundingRect(changed)
+        x0, y0 = max(0, x - self.pad), max(0, y - self.pad)
+        x1, y1 = min(gray.shape[1], x + w + self.pad), min(gray.shape[0], y + h + self.pad)
+        _, self.mask[y0:y1, x0:x1] = cv2.threshold(gray[y0:y1, x0:x1], self.level, 255, cv2.THRESH_BINARY_INV)
+
+        # Grow the region until it fully contains every component it
+        # touches, so re-finding contours inside it is exact
+        kept = self.components
+        while True:
+            touching = [c for c in kept if c[0] < x1 and c[0] + c[2] > x0 and c[1] < y1 and c[1] + c[3] > y0]
+            if not touching:
+                break
+            kept = [c for c in kept if not (c[0] < x1 and c[0] + c[2] > x0 and c[1] < y1 and c[1] + c[3] > y0)]
+            x0 = min([x0] + [c[0] for c in touching])
+            y0 = min([y0] + [c[1] for c in touching])
+            x1 = max([x1] + [c[0] + c[2] for c in touching])
+            y1 = max([y1] + [c[1] + c[3] for c in touching])
+
+        self.components = kept + self._find_components(x0, y0, x1, y1)
+        self.features = self._features()
+        return self.features, (x0, y0, x1 - x0, y1 - y0)
+
+    def recompute(self):
+        """Re-analyze the whole last frame from scratch with the session's
+        threshold level; the result should equal the incremental features."""
+        self.mask = cv2.threshold(self.gray, self.level, 255, cv2.THRESH_BINARY_INV)[1]
+        self.components = self._find_components(0, 0, self.gray.shape[1], self.gray.shape[0])
+        self.features = self._features()
+        return self.features
+
+    def _find_components(self, x0, y0, x1, y1):
+        contours, _ = cv2.findContours(self.mask[y0:y1, x0:x1], cv2.RETR_EXTERNAL,
+                                       cv2.CHAIN_APPROX_SIMPLE, offset=(x0, y0))
+        return [cv2.boundingRect(c) for c in contours]
+
+    def _features(self):
+        # Sorted so the result doesn't depend on the order updates arrived in
+        boxes = np.array(sorted(self.components), dtype=np.float64).reshape(-1, 4)
+        heights = boxes[boxes[:, 3] > 10, 3]
+
+        slant_angle = hough_slant(self.mask)
+        avg_letter_height = np.mean(heights) if len(heights) else 0
+        gaps = np.diff(np.sort(boxes[:, 0]))
+        avg_spacing = np.mean(gaps) if len(gaps) > 1 else 0
+
+        return {
+            "slant_angle": float(slant_angle),
+            "avg_letter_height": float(avg_letter_height),
+            "avg_spacing": float(avg_spacing)
+        }
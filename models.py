@@ -0,0 +1,41 @@
+from extensions import db
+
+
+# ✅ DATABASE MODELS
+class User(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100))
+    email = db.Column(db.String(120), unique=True)
+    password = db.Column(db.String(200))
+
+
+class Report(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    image_path = db.Column(db.String(200))
+    processed_path = db.Column(db.String(200))
+    neatness = db.Column(db.Float)
+    spacing = db.Column(db.Float)
+    consistency = db.Column(db.Float)
+    overall = db.Column(db.Float)
+    date = db.Column(db.String(50))
+    weak_areas = db.Column(db.String(200))
+    language = db.Column(db.String(20))
+
+
+# Progressive analysis: a quick provisional score from a downscaled proxy,
+# replaced by the full-resolution result when the background run finishes
+class AnalysisJob(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    report_id = db.Column(db.Integer, db.ForeignKey('report.id'))
+    image_path = db.Column(db.String(200))
+    image_hash = db.Column(db.String(40))
+    language = db.Column(db.String(20))
+    status = db.Column(db.String(20), default="provisional")
+    provisional_overall = db.Column(db.Float)
+    final_overall = db.Column(db.Float)
+    score_delta = db.Column(db.Float)
+    final_result = db.Column(db.Text)
+    preview_ms = db.Column(db.Float)
+    full_ms = db.Column(db.Float)
+    date = db.Column(db.String(50))
@@ -0,0 +1,186 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, shapeStr
+from reportlab.pdfgen import canvas
+
+from worksheet_text import UnsupportedWorksheet, WorksheetTooLong, pdf_supported, png_supported, text_runs
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_PATH = os.path.join(BASE_DIR, "static", "fonts", "NotoSansDevanagariUI-Regular.ttf")
+
+DEVANAGARI_FONT = "NotoSansDevanagariUI"
+pdfmetrics.registerFont(TTFont(DEVANAGARI_FONT, FONT_PATH, shapable=True))
+
+# Part of every cached file's name: bump it whenever the layout, fonts or
+# renderers change the output, so stale files are neither served from the
+# cache nor kept by browsers (they are cached for a year)
+RENDER_VERSION = 1
+
+# Page layout, in points from the top-left corner (mirrors worksheet.html)
+PAGE_WIDTH, PAGE_HEIGHT = letter
+MARGIN = 50
+HEADING_SIZE = 20
+SAMPLE_SIZE = 24
+SINGLE_RULES = (45, 90)        # two writing lines under the sample text
+DOUBLE_RULES = (15, 35, 55)    # handwriting-book guide lines
+LINE_GAP = 20
+PNG_DPI = 150
+PNG_MAX_PAGES = 4              # pages stacked into one PNG
+
+
+# ✅ Layout
+def _layout(heading, lines, double_line):
+    """Drawing ops for the worksheet as ("text", x, y, size, str, centered),
+    ("rule", y) and ("page",) tuples, with y measured down from the top of
+    the current page."""
+    ops = [("text", PAGE_WIDTH / 2, MARGIN + HEADING_SIZE, HEADING_SIZE, heading, True)]
+    rules = DOUBLE_RULES if double_line else SINGLE_RULES
+    block = SAMPLE_SIZE + rules[-1] + LINE_GAP
+    y = MARGIN + HEADING_SIZE + 30
+
+    for sample in lines:
+        if y + block > PAGE_HEIGHT - MARGIN:
+            ops.append(("page",))
+            y = MARGIN
+        ops.append(("text", MARGIN, y + SAMPLE_SIZE, SAMPLE_SIZE, sample, False))
+        for offset in rules:
+            ops.append(("rule", y + SAMPLE_SIZE + offset))
+        y += block
+
+    return ops
+
+
+def render_pdf(heading, lines, double_line=False):
+    if not pdf_supported(heading, lines):
+        raise UnsupportedWorksheet("PDF worksheets with Devanagari text need uharfbuzz (pip install uharfbuzz)")
+
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter)
+    c.setTitle(heading)
+    ops = _layout(heading, lines, double_line)
+
+    for op in ops:
+        if op[0] == "page":
+            c.showPage()
+        elif op[0] == "rule":
+            c.setLineWidth(1.5)
+            c.line(MARGIN, PAGE_HEIGHT - op[1], PAGE_WIDTH - MARGIN, PAGE_HEIGHT - op[1])
+        else:
+            _, x, y, size, text, centered = op
+            # Devanagari runs are shaped up front, so both the drawn glyphs
+            # and the measured widths are the reordered/joined ones
+            runs = [(DEVANAGARI_FONT, shapeStr(run, DEVANAGARI_FONT, size)) if dev else ("Helvetica", run)
+                    for dev, run in text_runs(text)]
+            widths = [c.stringWidth(run, font, size) for font, run in runs]
+            if centered:
+                x -= sum(widths) / 2
+            for (font, run), width in zip(runs, widths):
+                c.setFont(font, size)
+                c.drawString(x, PAGE_HEIGHT - y, run)
+                x += width
+
+    c.save()
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _png_font(devanagari, size):
+    if devanagari:
+        return ImageFont.truetype(FONT_PATH, size, layout_engine=ImageFont.Layout.RAQM)
+    return ImageFont.load_default(size)
+
+
+def render_png(heading, lines, double_line=False):
+    if not png_supported(heading, lines):
+        raise UnsupportedWorksheet("PNG worksheets with Devanagari text need Pillow built with libraqm")
+
+    # The PDF's pages stacked into one image, up to PNG_MAX_PAGES of them
+    ops = _layout(heading, lines, double_line)
+    pages = 1 + sum(op[0] == "page" for op in ops)
+    if pages > PNG_MAX_PAGES:
+        raise WorksheetTooLong(f"PNG worksheets are limited to {PNG_MAX_PAGES} pages; download the PDF instead")
+
+    scale = PNG_DPI / 72
+    img = Image.new("L", (round(PAGE_WIDTH * scale), round(pages * PAGE_HEIGHT * scale)), 255)
+    draw = ImageDraw.Draw(img)
+
+    top = 0
+    for op in ops:
+        if op[0] == "page":
+            top += PAGE_HEIGHT
+        elif op[0] == "rule":
+            y = (top + op[1]) * scale
+            draw.line([(MARGIN * scale, y), ((PAGE_WIDTH - MARGIN) * scale, y)], fill=0, width=2)
+        else:
+            _, x, y, size, text, centered = op
+            runs = [(_png_font(dev, round(size * scale)), run) for dev, run in text_runs(text)]
+            x *= scale
+            if centered:
+                x -= sum(font.getlength(run) for font, run in runs) / 2
+            for font, run in runs:
+                draw.text((x, (top + y) * scale), run, font=font, fill=0, anchor="ls")
+                x += font.getlength(run)
+
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+RENDERERS = {"pdf": render_pdf, "png": render_png}
+
+
+# ✅ Cache
+def worksheet_file(heading, lines, double_line=False, fmt="pdf", cache_dir="static/worksheets/generated",
+                   max_files=500):
+    """Path of the rendered worksheet, rendering it only on a cache miss.
+
+    Files are named by a hash of their parameters and RENDER_VERSION, so the
+    same sheet is rendered once and shared by every worker and request. A
+    miss that takes the cache past ``max_files`` removes the oldest files.
+    """
+    params = json.dumps([RENDER_VERSION, heading, list(lines), bool(double_line), fmt], ensure_ascii=False)
+    key = hashlib.sha1(params.encode("utf-8")).hexdigest()
+    path = os.path.join(cache_dir, f"{key}.{fmt}")
+
+    if os.path.exists(path):
+        return path
+
+    data = RENDERERS[fmt](heading, list(lines), double_line)
+    os.makedirs(cache_dir, exist_ok=True)
+    # A private temp file per render, renamed into place, so concurrent
+    # renders of the same sheet never see or clobber a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    _evict(cache_dir, max_files)
+    return path
+
+
+def _evict(cache_dir, max_files):
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith((".pdf", ".png")):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - max_files)]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
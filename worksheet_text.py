@@ -0,0 +1,53 @@
+import importlib.util
+import itertools
+from functools import lru_cache
+
+# Script checks for worksheet text. Kept apart from worksheet_service so the
+# practice pages can tell which downloads work without loading ReportLab,
+# Pillow and the fonts.
+
+
+class UnsupportedWorksheet(Exception):
+    """The worksheet needs a shaping library this install does not have."""
+
+
+class WorksheetTooLong(Exception):
+    """The worksheet is longer than the requested format allows."""
+
+
+# ✅ Text runs
+# The bundled Noto font only covers Devanagari (plus digits/punctuation), so
+# text is split into runs and Latin runs use a regular font
+def is_devanagari(ch):
+    return "\u0900" <= ch <= "\u097f" or "\ua8e0" <= ch <= "\ua8ff"
+
+
+def text_runs(text):
+    return [(dev, "".join(chars)) for dev, chars in itertools.groupby(text, key=is_devanagari)]
+
+
+def has_devanagari(heading, lines):
+    return any(is_devanagari(ch) for ch in itertools.chain(heading, *lines))
+
+
+# ✅ Shaping support
+# Devanagari needs shaping (matras, conjuncts): ReportLab does it through
+# uharfbuzz and Pillow through libraqm. Without them the characters would be
+# drawn one by one, so such worksheets are refused instead.
+@lru_cache(maxsize=None)
+def pdf_shaping():
+    return importlib.util.find_spec("uharfbuzz") is not None
+
+
+@lru_cache(maxsize=None)
+def png_shaping():
+    from PIL import features
+    return features.check("raqm")
+
+
+def pdf_supported(heading, lines):
+    return not has_devanagari(heading, lines) or pdf_shaping()
+
+
+def png_supported(heading, lines):
+    return not has_devanagari(heading, lines) or png_shaping()